@@ -1,7 +1,10 @@
 """Build and push Docker images for each microservice to ECR.
 
 Usage:
-    python build_and_push.py
+    python build_and_push.py [--sequential]
+
+Images are built and pushed concurrently, one worker per service. Pass
+--sequential to build them one at a time (easier to read the docker output).
 """
 
 import base64
@@ -9,6 +12,7 @@ import json
 import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 import boto3
 
@@ -72,8 +76,18 @@ def main():
     print("Logging in to ECR...")
     ecr_login(region, registry)
 
-    for service in SERVICES:
-        build_and_push(service, registry, repo_prefix, tag)
+    if "--sequential" in sys.argv[1:]:
+        for service in SERVICES:
+            build_and_push(service, registry, repo_prefix, tag)
+    else:
+        # Each build blocks in subprocess.run, so threads are enough to overlap them.
+        with ThreadPoolExecutor(max_workers=len(SERVICES)) as executor:
+            futures = [
+                executor.submit(build_and_push, service, registry, repo_prefix, tag)
+                for service in SERVICES
+            ]
+            for future in futures:
+                future.result()
 
     print("\nAll images pushed successfully.")
 
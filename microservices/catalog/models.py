@@ -23,5 +23,5 @@ class Product(db.Model):
             "description": self.description,
             "price": self.price,
             "image_path": self.image_path,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "created_at": self.created_at,
         }
@@ -1,19 +1,56 @@
-from flask import request, jsonify, Blueprint
+import orjson
+from flask import request, jsonify, Blueprint, Response
 from .models import db, Product
 from .storage import storage
 
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
 catalog_bp = Blueprint("catalog", __name__)
 
 
+def _json_response(data, status=200):
+    """Serialize with orjson, which also encodes datetimes natively."""
+    body = orjson.dumps(data, option=orjson.OPT_NAIVE_UTC)
+    return Response(body, status=status, mimetype="application/json")
+
+
 @catalog_bp.route("/products", methods=["GET"])
 def list_products():
-    products = Product.query.order_by(Product.created_at.desc()).all()
-    result = []
-    for p in products:
-        data = p.to_dict()
-        data["image_url"] = storage.get_url(p.image_path)
-        result.append(data)
-    return jsonify(result)
+    limit = request.args.get("limit", DEFAULT_PAGE_SIZE, type=int)
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    cursor = request.args.get("cursor", type=int)
+
+    query = db.select(
+        Product.id,
+        Product.name,
+        Product.description,
+        Product.price,
+        Product.image_path,
+        Product.created_at,
+    )
+    if cursor is not None:
+        # Keyset pagination on the primary key: ids grow with insertion, so
+        # this is newest first and still works if the cursor row is deleted.
+        query = query.where(Product.id < cursor)
+    query = query.order_by(Product.id.desc()).limit(limit)
+
+    rows = db.session.execute(query).all()
+    get_url = storage.get_url
+    result = [
+        {
+            "id": r.id,
+            "name": r.name,
+            "description": r.description,
+            "price": r.price,
+            "image_path": r.image_path,
+            "created_at": r.created_at,
+            "image_url": get_url(r.image_path),
+        }
+        for r in rows
+    ]
+    next_cursor = result[-1]["id"] if len(result) == limit else None
+    return _json_response({"items": result, "next_cursor": next_cursor})
 
 
 @catalog_bp.route("/products/<int:product_id>", methods=["GET"])
@@ -23,7 +60,7 @@ def get_product(product_id):
         return jsonify({"error": "Product not found"}), 404
     data = product.to_dict()
     data["image_url"] = storage.get_url(product.image_path)
-    return jsonify(data)
+    return _json_response(data)
 
 
 @catalog_bp.route("/products", methods=["POST"])
@@ -45,7 +82,7 @@ def create_product():
     db.session.add(product)
     db.session.commit()
 
-    return jsonify(product.to_dict()), 201
+    return _json_response(product.to_dict(), 201)
 
 
 @catalog_bp.route("/products/<int:product_id>", methods=["PUT"])
@@ -63,7 +100,7 @@ def update_product(product_id):
         product.price = data["price"]
 
     db.session.commit()
-    return jsonify(product.to_dict())
+    return _json_response(product.to_dict())
 
 
 @catalog_bp.route("/products/<int:product_id>", methods=["DELETE"])
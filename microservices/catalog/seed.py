@@ -2,6 +2,7 @@
 import os
 import shutil
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from .app import create_app
 from .models import db, Product
 
@@ -19,6 +20,14 @@ PRODUCTS = [
 app = create_app()
 
 
+def _place_image(src, dest):
+    # Seed images are never modified, so a hardlink is enough.
+    try:
+        os.link(src, dest)
+    except OSError:
+        shutil.copyfile(src, dest)
+
+
 def seed():
     with app.app_context():
         db.create_all()
@@ -27,17 +36,30 @@ def seed():
             return
 
         os.makedirs(UPLOAD_DIR, exist_ok=True)
+        copies = []
         for p in PRODUCTS:
             image_file = p.pop("image")
             src = os.path.join(SEED_IMAGES_DIR, image_file)
             if os.path.exists(src):
                 ext = os.path.splitext(image_file)[1]
                 dest_name = f"{uuid.uuid4().hex}{ext}"
-                shutil.copy2(src, os.path.join(UPLOAD_DIR, dest_name))
+                copies.append((p, src, os.path.join(UPLOAD_DIR, dest_name)))
                 p["image_path"] = f"uploads/{dest_name}"
 
-            product = Product(**p)
-            db.session.add(product)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [
+                (p, src, executor.submit(_place_image, src, dest))
+                for p, src, dest in copies
+            ]
+            for p, src, future in futures:
+                try:
+                    future.result()
+                except OSError as e:
+                    print(f"Could not copy {src}: {e}")
+                    p["image_path"] = ""
+
+        for p in PRODUCTS:
+            db.session.add(Product(**p))
 
         db.session.commit()
         print(f"Seeded {len(PRODUCTS)} products.")
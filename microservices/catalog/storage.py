@@ -1,8 +1,17 @@
+import functools
 import os
 import uuid
 import boto3
+from boto3.s3.transfer import TransferConfig
 from flask import current_app
 
+# Product images are usually well below this; anything smaller goes up in a
+# single PutObject instead of the managed-transfer state machine.
+_SINGLE_PUT_LIMIT = 5 * 1024 * 1024
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=_SINGLE_PUT_LIMIT, max_concurrency=4, use_threads=True
+)
+
 
 class LocalStorage:
     def save(self, file):
@@ -29,17 +38,34 @@ class LocalStorage:
             os.remove(filepath)
 
 
+@functools.lru_cache(maxsize=1)
+def _s3_client():
+    return boto3.client("s3")
+
+
 class S3Storage:
     def __init__(self, bucket):
         self.bucket = bucket
-        self.s3 = boto3.client("s3")
+        self.s3 = _s3_client()
 
     def save(self, file):
         ext = os.path.splitext(file.filename)[1] or ".jpg"
         key = f"uploads/{uuid.uuid4().hex}{ext}"
-        self.s3.upload_fileobj(file, self.bucket, key, ExtraArgs={
-            "ContentType": file.content_type or "application/octet-stream",
-        })
+        content_type = file.content_type or "application/octet-stream"
+        body = file.read(_SINGLE_PUT_LIMIT)
+        if len(body) < _SINGLE_PUT_LIMIT:
+            self.s3.put_object(
+                Bucket=self.bucket, Key=key, Body=body, ContentType=content_type
+            )
+        else:
+            file.seek(0)
+            self.s3.upload_fileobj(
+                file,
+                self.bucket,
+                key,
+                ExtraArgs={"ContentType": content_type},
+                Config=_TRANSFER_CONFIG,
+            )
         return key
 
     def get_url(self, image_path):
@@ -1,6 +1,13 @@
-from flask import render_template, redirect, request, Blueprint
+from concurrent.futures import ThreadPoolExecutor
+from flask import render_template, redirect, request, Blueprint, copy_current_request_context
 from .service_client import ServiceClient
 
+# Shared pool for issuing independent backend calls concurrently.
+_executor = ThreadPoolExecutor(max_workers=16)
+
+# The admin page walks the whole catalog at the catalog's maximum page size.
+ADMIN_PAGE_SIZE = 200
+
 frontend_bp = Blueprint(
     "frontend", __name__, template_folder="templates"
 )
@@ -8,20 +15,35 @@ frontend_bp = Blueprint(
 
 @frontend_bp.route("/")
 def index():
-    products = ServiceClient.get("catalog", "/api/products")
-    return render_template("index.html", products=products)
+    params = {}
+    cursor = request.args.get("cursor", type=int)
+    if cursor is not None:
+        params["cursor"] = cursor
+    page = ServiceClient.get("catalog", "/api/products", params=params)
+    return render_template(
+        "index.html", products=page["items"], next_cursor=page["next_cursor"]
+    )
 
 
 @frontend_bp.route("/products/<int:product_id>")
 def product_detail(product_id):
-    product = ServiceClient.get("catalog", f"/api/products/{product_id}")
+    get = copy_current_request_context(ServiceClient.get)
+    product_future = _executor.submit(get, "catalog", f"/api/products/{product_id}")
     inventory = ServiceClient.get("inventory", f"/api/inventory/{product_id}")
+    product = product_future.result()
     return render_template("product.html", product=product, inventory=inventory)
 
 
 @frontend_bp.route("/admin")
 def admin():
-    products = ServiceClient.get("catalog", "/api/products")
+    products = []
+    params = {"limit": ADMIN_PAGE_SIZE}
+    while True:
+        page = ServiceClient.get("catalog", "/api/products", params=params)
+        products.extend(page["items"])
+        if page["next_cursor"] is None:
+            break
+        params["cursor"] = page["next_cursor"]
     return render_template("admin.html", products=products)
 
 
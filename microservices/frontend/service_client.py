@@ -1,5 +1,18 @@
+import orjson
 import requests
 from flask import current_app
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# One pooled, keep-alive session shared by every request in the process.
+_session = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(total=2, backoff_factor=0.1),
+)
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
 
 
 class ServiceClient:
@@ -8,23 +21,23 @@ class ServiceClient:
     @staticmethod
     def get(service, path, **kwargs):
         url = _get_service_url(service)
-        resp = requests.get(f"{url}{path}", **kwargs)
+        resp = _session.get(f"{url}{path}", **kwargs)
         resp.raise_for_status()
-        return resp.json()
+        return orjson.loads(resp.content)
 
     @staticmethod
     def post(service, path, **kwargs):
         url = _get_service_url(service)
-        resp = requests.post(f"{url}{path}", **kwargs)
+        resp = _session.post(f"{url}{path}", **kwargs)
         resp.raise_for_status()
-        return resp.json()
+        return orjson.loads(resp.content)
 
     @staticmethod
     def put(service, path, **kwargs):
         url = _get_service_url(service)
-        resp = requests.put(f"{url}{path}", **kwargs)
+        resp = _session.put(f"{url}{path}", **kwargs)
         resp.raise_for_status()
-        return resp.json()
+        return orjson.loads(resp.content)
 
 
 def _get_service_url(service):
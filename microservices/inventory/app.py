@@ -1,8 +1,15 @@
+import threading
+import time
 from flask import Flask, jsonify
 from .config import Config
 from .models import db
 from .routes import inventory_bp
 
+# Probes within this window reuse the last successful DB check.
+HEALTH_CACHE_TTL = 1.0
+_health_lock = threading.Lock()
+_last_healthy = 0.0
+
 
 def create_app():
     app = Flask(__name__)
@@ -14,7 +21,16 @@ def create_app():
 
     @app.route("/health")
     def health():
-        db.session.execute(db.text("SELECT 1"))
+        global _last_healthy
+        if time.monotonic() - _last_healthy < HEALTH_CACHE_TTL:
+            return jsonify({"status": "healthy"})
+        with _health_lock:
+            if time.monotonic() - _last_healthy >= HEALTH_CACHE_TTL:
+                try:
+                    db.session.execute(db.text("SELECT 1"))
+                except Exception:
+                    return jsonify({"status": "unhealthy"}), 503
+                _last_healthy = time.monotonic()
         return jsonify({"status": "healthy"})
 
     with app.app_context():
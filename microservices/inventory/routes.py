@@ -1,4 +1,6 @@
+from datetime import datetime, timezone
 from flask import request, jsonify, Blueprint
+from sqlalchemy.dialects.postgresql import insert
 from .models import db, Inventory
 
 inventory_bp = Blueprint("inventory", __name__)
@@ -6,8 +8,15 @@ inventory_bp = Blueprint("inventory", __name__)
 
 @inventory_bp.route("/inventory", methods=["GET"])
 def list_inventory():
-    items = Inventory.query.all()
-    return jsonify([i.to_dict() for i in items])
+    query = Inventory.query
+    product_ids = request.args.get("product_ids")
+    if product_ids:
+        try:
+            ids = [int(v) for v in product_ids.split(",") if v.strip()]
+        except ValueError:
+            return jsonify({"error": "product_ids must be a comma-separated list of integers"}), 400
+        query = query.filter(Inventory.product_id.in_(ids))
+    return jsonify([i.to_dict() for i in query.all()])
 
 
 @inventory_bp.route("/inventory/<int:product_id>", methods=["GET"])
@@ -21,20 +30,19 @@ def get_inventory(product_id):
 @inventory_bp.route("/inventory/<int:product_id>", methods=["PUT"])
 def update_inventory(product_id):
     data = request.get_json()
-    item = Inventory.query.filter_by(product_id=product_id).first()
-
-    if not item:
-        item = Inventory(
-            product_id=product_id,
-            quantity=data.get("quantity", 0),
-            warehouse=data.get("warehouse", "main"),
-        )
-        db.session.add(item)
-    else:
-        if "quantity" in data:
-            item.quantity = data["quantity"]
-        if "warehouse" in data:
-            item.warehouse = data["warehouse"]
-
+    stmt = insert(Inventory).values(
+        product_id=product_id,
+        quantity=data.get("quantity", 0),
+        warehouse=data.get("warehouse", "main"),
+    )
+    # On an existing row only the fields present in the request change.
+    updates = {k: stmt.excluded[k] for k in ("quantity", "warehouse") if k in data}
+    updates["updated_at"] = datetime.now(timezone.utc)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Inventory.product_id], set_=updates
+    ).returning(Inventory)
+    item = db.session.scalars(
+        stmt, execution_options={"populate_existing": True}
+    ).one()
     db.session.commit()
     return jsonify(item.to_dict())
@@ -9,32 +9,43 @@ Environment variables:
     INVENTORY_DB_SECRET     - AWS Secrets Manager secret name for inventory DB credentials
     INVENTORY_DB_NAME       - Database name for inventory (used with INVENTORY_DB_SECRET)
     TARGET_S3_BUCKET        - S3 bucket name for image upload (if not set, images are copied locally)
+    S3_UPLOAD_WORKERS       - number of concurrent S3 uploads (default: 16)
 
 Usage:
     python migrate.py
 """
 
+import functools
+import io
 import json
-import mimetypes
 import os
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import psycopg2
+from psycopg2.extras import execute_values
 
 
+@functools.lru_cache(maxsize=None)
+def _get_sm_client(region):
+    import boto3
+
+    return boto3.client("secretsmanager", region_name=region)
+
+
+@functools.lru_cache(maxsize=None)
 def get_db_url_from_secret(secret_name, dbname):
     """Retrieve a database URL from AWS Secrets Manager.
 
     Expects the secret to contain JSON with keys:
         host, port, username, password
     The dbname is provided separately since the secret typically
-    contains only connection credentials.
+    contains only connection credentials. Results are cached per
+    (secret_name, dbname), and one client is shared across lookups.
     """
-    import boto3
-
     region = os.environ.get("AWS_REGION", os.environ.get("AWS_DEFAULT_REGION", "us-east-1"))
-    client = boto3.client("secretsmanager", region_name=region)
+    client = _get_sm_client(region)
     resp = client.get_secret_value(SecretId=secret_name)
     secret = json.loads(resp["SecretString"])
     return (
@@ -81,11 +92,27 @@ if not CATALOG_URL or not INVENTORY_URL:
     print("  export INVENTORY_DB_NAME=dbinventory01")
     sys.exit(1)
 
+# Upload extensions we actually see; avoids mimetypes' lazy init and locking per file.
+IMAGE_CONTENT_TYPES = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+}
+
 UPLOADS_SRC = os.path.join(os.path.dirname(__file__), "monolith", "static", "uploads")
 UPLOADS_DST = os.path.join(
     os.path.dirname(__file__), "microservices", "catalog", "static", "uploads"
 )
 
+PRODUCT_COLUMNS = ("id", "name", "description", "price", "image_path", "created_at")
+INVENTORY_COLUMNS = ("id", "product_id", "quantity", "warehouse", "updated_at")
+# Rows fetched from the monolith and COPYed per round-trip.
+BATCH_SIZE = 10000
+# Rows per multi-row INSERT when COPY is unavailable; Postgres gains little past ~1000.
+INSERT_PAGE_SIZE = 1000
+
 
 def create_tables(catalog_conn, inventory_conn):
     """Create target tables if they don't exist."""
@@ -100,7 +127,6 @@ def create_tables(catalog_conn, inventory_conn):
                 created_at TIMESTAMP DEFAULT (NOW() AT TIME ZONE 'utc')
             )
         """)
-    catalog_conn.commit()
 
     with inventory_conn.cursor() as cur:
         cur.execute("""
@@ -112,87 +138,204 @@ def create_tables(catalog_conn, inventory_conn):
                 updated_at TIMESTAMP DEFAULT (NOW() AT TIME ZONE 'utc')
             )
         """)
+        # Tables from before product_id became unique keep their plain index;
+        # keep the lowest-id row per product and rebuild it as unique.
         cur.execute("""
-            CREATE INDEX IF NOT EXISTS ix_inventory_product_id ON inventory (product_id)
+            SELECT i.indisunique FROM pg_index i
+            JOIN pg_class c ON c.oid = i.indexrelid
+            WHERE c.relname = 'ix_inventory_product_id'
         """)
-    inventory_conn.commit()
+        row = cur.fetchone()
+        if not (row and row[0]):
+            cur.execute("""
+                DELETE FROM inventory a USING inventory b
+                WHERE a.product_id = b.product_id AND a.id > b.id
+            """)
+            cur.execute("DROP INDEX IF EXISTS ix_inventory_product_id")
+            cur.execute("""
+                CREATE UNIQUE INDEX ix_inventory_product_id ON inventory (product_id)
+            """)
     print("Target tables verified.")
 
 
-def migrate_products(mono_conn, catalog_conn):
-    with mono_conn.cursor() as src:
-        src.execute(
-            "SELECT id, name, description, price, image_path, created_at FROM products"
-        )
-        rows = src.fetchall()
+def _copy_value(value):
+    """Encode one value for COPY's text format."""
+    if value is None:
+        return "\\N"
+    if hasattr(value, "isoformat"):
+        value = value.isoformat()
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def _copy_chunk(dst, stage, columns, rows):
+    buf = io.StringIO()
+    for row in rows:
+        buf.write("\t".join(_copy_value(v) for v in row))
+        buf.write("\n")
+    buf.seek(0)
+    dst.copy_expert(f"COPY {stage} ({', '.join(columns)}) FROM STDIN", buf)
 
-    if not rows:
-        print("No products to migrate.")
-        return
 
-    with catalog_conn.cursor() as dst:
-        for row in rows:
+def _create_stage(dst, table, stage, columns):
+    """Create the COPY staging table, or return False if COPY can't be used here.
+
+    Some managed Postgres setups deny temp tables or COPY; the probe runs in a
+    savepoint so the surrounding transaction survives the failure.
+    """
+    dst.execute("SAVEPOINT create_stage")
+    try:
+        dst.execute(
+            f"CREATE TEMP TABLE {stage} (LIKE {table} INCLUDING DEFAULTS) ON COMMIT DROP"
+        )
+        _copy_chunk(dst, stage, columns, [])
+    except psycopg2.Error as e:
+        dst.execute("ROLLBACK TO SAVEPOINT create_stage")
+        print(f"  COPY unavailable for {table} ({e.pgcode}), using batched INSERTs.")
+        return False
+    dst.execute("RELEASE SAVEPOINT create_stage")
+    return True
+
+
+def _migrate_table(src_conn, dst_conn, table, columns):
+    """Stream a table from the monolith into a microservice database.
+
+    Rows are read through a server-side cursor BATCH_SIZE at a time and each
+    batch is COPYed into a temp staging table, so memory stays bounded by the
+    batch size. A single INSERT ... SELECT then moves them into the real
+    table; ON CONFLICT DO NOTHING skips rows already present by id (or, for
+    inventory, by product_id) and keeps the migration re-runnable. If
+    COPY is not permitted, batches go in as multi-row INSERTs instead.
+    Returns the number of rows read from the source.
+    """
+    cols = ", ".join(columns)
+    stage = f"{table}_stage"
+    total = 0
+    with src_conn.cursor(name=f"migrate_{table}") as src, dst_conn.cursor() as dst:
+        src.itersize = BATCH_SIZE
+        src.execute(f"SELECT {cols} FROM {table}")
+        use_copy = _create_stage(dst, table, stage, columns)
+        for rows in iter(lambda: src.fetchmany(BATCH_SIZE), []):
+            if use_copy:
+                _copy_chunk(dst, stage, columns, rows)
+            else:
+                execute_values(
+                    dst,
+                    f"INSERT INTO {table} ({cols}) VALUES %s ON CONFLICT DO NOTHING",
+                    rows,
+                    page_size=INSERT_PAGE_SIZE,
+                )
+            total += len(rows)
+        if total:
+            if use_copy:
+                dst.execute(
+                    f"INSERT INTO {table} ({cols}) SELECT {cols} FROM {stage} "
+                    "ON CONFLICT DO NOTHING"
+                )
             dst.execute(
-                "INSERT INTO products (id, name, description, price, image_path, created_at) "
-                "VALUES (%s, %s, %s, %s, %s, %s) "
-                "ON CONFLICT (id) DO NOTHING",
-                row,
+                f"SELECT setval('{table}_id_seq', "
+                f"(SELECT COALESCE(MAX(id), 0) + 1 FROM {table}), false)"
             )
-        dst.execute("SELECT setval('products_id_seq', (SELECT COALESCE(MAX(id), 0) + 1 FROM products), false)")
-    catalog_conn.commit()
-    print(f"Migrated {len(rows)} products.")
+    return total
 
 
-def migrate_inventory(mono_conn, inventory_conn):
-    with mono_conn.cursor() as src:
-        src.execute(
-            "SELECT id, product_id, quantity, warehouse, updated_at FROM inventory"
-        )
-        rows = src.fetchall()
+def migrate_products(mono_conn, catalog_conn):
+    count = _migrate_table(mono_conn, catalog_conn, "products", PRODUCT_COLUMNS)
+    if not count:
+        print("No products to migrate.")
+        return
+    print(f"Migrated {count} products.")
+
 
-    if not rows:
+def migrate_inventory(mono_conn, inventory_conn):
+    count = _migrate_table(mono_conn, inventory_conn, "inventory", INVENTORY_COLUMNS)
+    if not count:
         print("No inventory to migrate.")
         return
+    print(f"Migrated {count} inventory records.")
 
-    with inventory_conn.cursor() as dst:
-        for row in rows:
-            dst.execute(
-                "INSERT INTO inventory (id, product_id, quantity, warehouse, updated_at) "
-                "VALUES (%s, %s, %s, %s, %s) "
-                "ON CONFLICT (id) DO NOTHING",
-                row,
-            )
-        dst.execute("SELECT setval('inventory_id_seq', (SELECT COALESCE(MAX(id), 0) + 1 FROM inventory), false)")
-    inventory_conn.commit()
-    print(f"Migrated {len(rows)} inventory records.")
+
+def _list_uploads():
+    """Regular files in UPLOADS_SRC as DirEntry objects, sorted by name.
+
+    scandir's cached file type avoids a stat() per entry.
+    """
+    with os.scandir(UPLOADS_SRC) as it:
+        return sorted((e for e in it if e.is_file()), key=lambda e: e.name)
 
 
 def migrate_images_s3(bucket_name):
     import boto3
+    from boto3.s3.transfer import TransferConfig
+    from botocore.config import Config as BotoConfig
 
-    s3 = boto3.client("s3")
-    files = [f for f in os.listdir(UPLOADS_SRC) if os.path.isfile(os.path.join(UPLOADS_SRC, f))]
+    files = _list_uploads()
     if not files:
         print("No images to upload.")
         return
-    for filename in sorted(files):
-        filepath = os.path.join(UPLOADS_SRC, filename)
+
+    workers = int(os.environ.get("S3_UPLOAD_WORKERS", "16"))
+    # Large images are split into 8 MiB parts uploaded in parallel. Total
+    # concurrency is workers x max_concurrency; keep it within NIC bandwidth.
+    transfer_config = TransferConfig(
+        multipart_threshold=8 * 1024 * 1024,
+        multipart_chunksize=8 * 1024 * 1024,
+        max_concurrency=16,
+        use_threads=True,
+    )
+    # Clients are thread-safe; size the pool for every part upload that can be
+    # in flight at once (each worker's transfer runs max_concurrency threads).
+    # Adaptive retries rate-limit client-side when S3 throttles (503 SlowDown)
+    # instead of every worker backing off and retrying independently.
+    s3 = boto3.client("s3", config=BotoConfig(
+        max_pool_connections=workers * transfer_config.max_concurrency,
+        retries={"mode": "adaptive", "max_attempts": 10},
+        tcp_keepalive=True,
+    ))
+
+    def upload(entry):
+        filename = entry.name
         key = f"uploads/{filename}"
-        content_type = mimetypes.guess_type(filepath)[0] or "application/octet-stream"
-        s3.upload_file(filepath, bucket_name, key, ExtraArgs={"ContentType": content_type})
-        print(f"  Uploaded {filename} -> s3://{bucket_name}/{key}")
+        content_type = IMAGE_CONTENT_TYPES.get(
+            os.path.splitext(filename)[1].lower(), "application/octet-stream"
+        )
+        s3.upload_file(
+            entry.path,
+            bucket_name,
+            key,
+            ExtraArgs={"ContentType": content_type},
+            Config=transfer_config,
+        )
+        return filename, key
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(upload, entry) for entry in files]
+        for future in as_completed(futures):
+            filename, key = future.result()
+            print(f"  Uploaded {filename} -> s3://{bucket_name}/{key}")
     print(f"Uploaded {len(files)} images to S3.")
 
 
 def migrate_images_local():
     os.makedirs(UPLOADS_DST, exist_ok=True)
-    files = [f for f in os.listdir(UPLOADS_SRC) if os.path.isfile(os.path.join(UPLOADS_SRC, f))]
+    files = _list_uploads()
     if not files:
         print("No images to copy.")
         return
-    for filename in sorted(files):
-        shutil.copy2(os.path.join(UPLOADS_SRC, filename), os.path.join(UPLOADS_DST, filename))
-        print(f"  Copied {filename}")
+
+    def copy(entry):
+        # copy2 uses the kernel's in-kernel copy path on Linux, releasing the GIL.
+        shutil.copy2(entry.path, os.path.join(UPLOADS_DST, entry.name))
+        return entry.name
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for filename in executor.map(copy, files):
+            print(f"  Copied {filename}")
     print(f"Copied {len(files)} images to {UPLOADS_DST}")
 
 
@@ -202,6 +345,13 @@ def main():
     inventory_conn = psycopg2.connect(INVENTORY_URL)
 
     try:
+        # Each target database is migrated in a single transaction. A failed
+        # run rolls back and can simply be re-run, so skip waiting for the WAL
+        # flush on commit.
+        for conn in (catalog_conn, inventory_conn):
+            with conn.cursor() as cur:
+                cur.execute("SET LOCAL synchronous_commit = off")
+
         print("Creating target tables if needed...")
         create_tables(catalog_conn, inventory_conn)
 
@@ -211,6 +361,9 @@ def main():
         print("Migrating inventory...")
         migrate_inventory(mono_conn, inventory_conn)
 
+        catalog_conn.commit()
+        inventory_conn.commit()
+
         print("\nMigrating images...")
         bucket_name = os.environ.get("TARGET_S3_BUCKET")
         if bucket_name:
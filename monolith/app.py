@@ -1,6 +1,34 @@
 from flask import Flask
 from config import Config
 from services.catalog.models import db
+from services.frontend import frontend_bp
+from services.catalog import catalog_bp
+from services.inventory import inventory_bp
+
+
+def _unique_inventory_product_index():
+    """Rebuild a non-unique ix_inventory_product_id as a unique index.
+
+    create_all() leaves tables from before the index became unique alone,
+    and the inventory upsert needs the constraint. Duplicate rows for a
+    product are collapsed to the one with the lowest id.
+    """
+    with db.engine.begin() as conn:
+        unique = conn.execute(db.text(
+            "SELECT i.indisunique FROM pg_index i "
+            "JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE c.relname = 'ix_inventory_product_id'"
+        )).scalar()
+        if unique:
+            return
+        conn.execute(db.text(
+            "DELETE FROM inventory a USING inventory b "
+            "WHERE a.product_id = b.product_id AND a.id > b.id"
+        ))
+        conn.execute(db.text("DROP INDEX IF EXISTS ix_inventory_product_id"))
+        conn.execute(db.text(
+            "CREATE UNIQUE INDEX ix_inventory_product_id ON inventory (product_id)"
+        ))
 
 
 def create_app():
@@ -9,16 +37,21 @@ def create_app():
 
     db.init_app(app)
 
-    from services.frontend import frontend_bp
-    from services.catalog import catalog_bp
-    from services.inventory import inventory_bp
-
     app.register_blueprint(frontend_bp)
     app.register_blueprint(catalog_bp, url_prefix="/api")
     app.register_blueprint(inventory_bp, url_prefix="/api")
 
-    with app.app_context():
+    @app.cli.command("db-init")
+    def db_init():
+        """Create all database tables and upgrade existing ones."""
         db.create_all()
+        if db.engine.dialect.name == "postgresql":
+            _unique_inventory_product_index()
+        print("Database tables created.")
+
+    if app.config["CREATE_ALL_ON_STARTUP"]:
+        with app.app_context():
+            db.create_all()
 
     return app
 
@@ -28,7 +28,7 @@ with app.app_context():
         print("Database already has data. Skipping seed.")
     else:
         os.makedirs(UPLOAD_DIR, exist_ok=True)
-        for i, p in enumerate(PRODUCTS):
+        for p in PRODUCTS:
             image_file = p.pop("image")
             src = os.path.join(SEED_IMAGES_DIR, image_file)
             if os.path.exists(src):
@@ -37,11 +37,13 @@ with app.app_context():
                 shutil.copy2(src, os.path.join(UPLOAD_DIR, dest_name))
                 p["image_path"] = f"uploads/{dest_name}"
 
-            product = Product(**p)
-            db.session.add(product)
-            db.session.flush()
-            inv = Inventory(product_id=product.id, quantity=STOCK[i], warehouse="main")
-            db.session.add(inv)
-
+        # One flush assigns every product id; inventory rows then reference them.
+        products = [Product(**p) for p in PRODUCTS]
+        db.session.add_all(products)
+        db.session.flush()
+        db.session.add_all([
+            Inventory(product_id=product.id, quantity=quantity, warehouse="main")
+            for product, quantity in zip(products, STOCK)
+        ])
         db.session.commit()
         print(f"Seeded {len(PRODUCTS)} products with inventory.")
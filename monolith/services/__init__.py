@@ -1,5 +1,20 @@
+import functools
 import requests
 from flask import current_app
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from werkzeug.exceptions import HTTPException
+from werkzeug.routing import Map, Rule
+
+# One pooled, keep-alive session shared by all microservice-mode calls.
+_session = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+)
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
 
 
 class ServiceClient:
@@ -15,16 +30,32 @@ class ServiceClient:
         url = _get_service_url(service)
         if url is None:
             return _local_call("GET", service, path, **kwargs)
-        resp = requests.get(f"{url}/api{path}", **kwargs)
+        resp = _session.get(f"{url}/api{path}", **kwargs)
         resp.raise_for_status()
         return resp.json()
 
+    @staticmethod
+    def get_bulk(service, path, param, ids, **kwargs):
+        """GET a collection filtered to ids in one call.
+
+        e.g. get_bulk("inventory", "/inventory", "product_ids", [1, 2])
+        requests /inventory?product_ids=1,2.
+        """
+        params = dict(kwargs.pop("params", None) or {})
+        params[param] = ",".join(str(i) for i in ids)
+        return ServiceClient.get(service, path, params=params, **kwargs)
+
+    @staticmethod
+    def is_local(service):
+        """True when the service is served in-process (monolith mode)."""
+        return _get_service_url(service) is None
+
     @staticmethod
     def put(service, path, **kwargs):
         url = _get_service_url(service)
         if url is None:
             return _local_call("PUT", service, path, **kwargs)
-        resp = requests.put(f"{url}/api{path}", **kwargs)
+        resp = _session.put(f"{url}/api{path}", **kwargs)
         resp.raise_for_status()
         return resp.json()
 
@@ -37,15 +68,46 @@ def _get_service_url(service):
     return None
 
 
+@functools.lru_cache(maxsize=None)
+def _local_routes():
+    """Map "/<service><path>" to the service-layer function that answers it."""
+    from services.catalog import api as catalog_api
+    from services.inventory import api as inventory_api
+
+    def list_products(params=None, **_):
+        return catalog_api.list_products(**(params or {}))
+
+    def get_product(product_id, **_):
+        data = catalog_api.get_product(product_id)
+        if data is None:
+            return {"error": "Product not found"}
+        return data
+
+    def list_inventory(params=None, **_):
+        product_ids = inventory_api.parse_product_ids((params or {}).get("product_ids"))
+        return inventory_api.list_inventory(product_ids)
+
+    def get_inventory(product_id, **_):
+        return inventory_api.get_inventory(product_id)
+
+    def update_inventory(product_id, json=None, **_):
+        return inventory_api.update_inventory(product_id, json or {})
+
+    return Map([
+        Rule("/catalog/products", methods=["GET"], endpoint=list_products),
+        Rule("/catalog/products/<int:product_id>", methods=["GET"], endpoint=get_product),
+        Rule("/inventory/inventory", methods=["GET"], endpoint=list_inventory),
+        Rule("/inventory/inventory/<int:product_id>", methods=["GET"], endpoint=get_inventory),
+        Rule("/inventory/inventory/<int:product_id>", methods=["PUT"], endpoint=update_inventory),
+    ])
+
+
 def _local_call(method, service, path, **kwargs):
-    """Make an internal call using Flask's test client."""
-    with current_app.test_client() as client:
-        prefix = "/api"
-        full_path = f"{prefix}{path}"
-        if method == "GET":
-            resp = client.get(full_path)
-        elif method == "PUT":
-            resp = client.put(full_path, json=kwargs.get("json"))
-        else:
-            resp = client.get(full_path)
-        return resp.get_json()
+    """Call the service layer directly, skipping HTTP dispatch and JSON."""
+    try:
+        handler, path_args = _local_routes().bind("localhost").match(
+            f"/{service}{path}", method=method
+        )
+    except HTTPException as e:
+        return {"error": e.description}
+    return handler(**path_args, **kwargs)
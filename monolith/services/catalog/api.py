@@ -0,0 +1,59 @@
+"""Catalog service layer.
+
+These functions return plain dicts. The HTTP routes wrap them in JSON
+responses, and ServiceClient calls them directly in monolith mode.
+"""
+from .models import db, Product
+from .storage import storage
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def product_to_dict(product):
+    data = product.to_dict()
+    data["image_url"] = storage.get_url(product.image_path)
+    return data
+
+
+def list_products(limit=DEFAULT_PAGE_SIZE, cursor=None):
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+
+    query = db.select(
+        Product.id,
+        Product.name,
+        Product.description,
+        Product.price,
+        Product.image_path,
+        Product.created_at,
+    )
+    if cursor is not None:
+        # Keyset pagination on the primary key: ids grow with insertion, so
+        # this is newest first and still works if the cursor row is deleted.
+        query = query.where(Product.id < cursor)
+    query = query.order_by(Product.id.desc()).limit(limit)
+
+    # Build each row's dict once from the selected columns; no ORM instances.
+    get_url = storage.get_url
+    result = [
+        {
+            "id": r.id,
+            "name": r.name,
+            "description": r.description,
+            "price": r.price,
+            "image_path": r.image_path,
+            "created_at": r.created_at.isoformat() if r.created_at else None,
+            "image_url": get_url(r.image_path),
+        }
+        for r in db.session.execute(query)
+    ]
+    next_cursor = result[-1]["id"] if len(result) == limit else None
+    return {"items": result, "next_cursor": next_cursor}
+
+
+def get_product(product_id):
+    """Return the product as a dict, or None if it doesn't exist."""
+    product = db.session.get(Product, product_id)
+    if not product:
+        return None
+    return product_to_dict(product)
@@ -1,27 +1,22 @@
 from flask import request, jsonify
 from . import catalog_bp
+from . import api
 from .models import db, Product
 from .storage import storage
 
 
 @catalog_bp.route("/products", methods=["GET"])
 def list_products():
-    products = Product.query.order_by(Product.created_at.desc()).all()
-    result = []
-    for p in products:
-        data = p.to_dict()
-        data["image_url"] = storage.get_url(p.image_path)
-        result.append(data)
-    return jsonify(result)
+    limit = request.args.get("limit", api.DEFAULT_PAGE_SIZE, type=int)
+    cursor = request.args.get("cursor", type=int)
+    return jsonify(api.list_products(limit=limit, cursor=cursor))
 
 
 @catalog_bp.route("/products/<int:product_id>", methods=["GET"])
 def get_product(product_id):
-    product = db.session.get(Product, product_id)
-    if not product:
+    data = api.get_product(product_id)
+    if data is None:
         return jsonify({"error": "Product not found"}), 404
-    data = product.to_dict()
-    data["image_url"] = storage.get_url(product.image_path)
     return jsonify(data)
 
 
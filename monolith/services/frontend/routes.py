@@ -1,24 +1,69 @@
-from flask import render_template, redirect, url_for, request, flash
+from concurrent.futures import ThreadPoolExecutor
+from flask import render_template, redirect, url_for, request, flash, copy_current_request_context
 from . import frontend_bp
 from services import ServiceClient
 
+# Shared pool for issuing independent remote service calls concurrently.
+_executor = ThreadPoolExecutor(max_workers=16)
+
+# The admin page walks the whole catalog at the catalog's maximum page size.
+ADMIN_PAGE_SIZE = 200
+
 
 @frontend_bp.route("/")
 def index():
-    products = ServiceClient.get("catalog", "/products")
-    return render_template("index.html", products=products)
+    params = {}
+    cursor = request.args.get("cursor", type=int)
+    if cursor is not None:
+        params["cursor"] = cursor
+    page = ServiceClient.get("catalog", "/products", params=params)
+    return render_template(
+        "index.html", products=page["items"], next_cursor=page["next_cursor"]
+    )
+
+
+def _local_product_with_inventory(product_id):
+    """Fetch a product and its stock in one joined query (monolith mode only)."""
+    from services.catalog.api import product_to_dict
+    from services.catalog.models import db, Product
+    from services.inventory.api import _default_inventory
+    from services.inventory.models import Inventory
+
+    row = (
+        db.session.query(Product, Inventory)
+        .outerjoin(Inventory, Inventory.product_id == Product.id)
+        .filter(Product.id == product_id)
+        .first()
+    )
+    product, item = row if row else (None, None)
+    inventory = item.to_dict() if item else _default_inventory(product_id)
+    if product is None:
+        return {"error": "Product not found"}, inventory
+    return product_to_dict(product), inventory
 
 
 @frontend_bp.route("/products/<int:product_id>")
 def product_detail(product_id):
-    product = ServiceClient.get("catalog", f"/products/{product_id}")
-    inventory = ServiceClient.get("inventory", f"/inventory/{product_id}")
+    if ServiceClient.is_local("catalog") and ServiceClient.is_local("inventory"):
+        product, inventory = _local_product_with_inventory(product_id)
+    else:
+        get = copy_current_request_context(ServiceClient.get)
+        product_future = _executor.submit(get, "catalog", f"/products/{product_id}")
+        inventory = ServiceClient.get("inventory", f"/inventory/{product_id}")
+        product = product_future.result()
     return render_template("product.html", product=product, inventory=inventory)
 
 
 @frontend_bp.route("/admin")
 def admin():
-    products = ServiceClient.get("catalog", "/products")
+    products = []
+    params = {"limit": ADMIN_PAGE_SIZE}
+    while True:
+        page = ServiceClient.get("catalog", "/products", params=params)
+        products.extend(page["items"])
+        if page["next_cursor"] is None:
+            break
+        params["cursor"] = page["next_cursor"]
     return render_template("admin.html", products=products)
 
 
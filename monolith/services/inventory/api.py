@@ -0,0 +1,54 @@
+"""Inventory service layer.
+
+These functions return plain dicts. The HTTP routes wrap them in JSON
+responses, and ServiceClient calls them directly in monolith mode.
+"""
+from datetime import datetime, timezone
+from sqlalchemy.dialects.postgresql import insert
+from .models import db, Inventory
+
+
+def parse_product_ids(value):
+    """Parse a "1,2,3" query value into a list of ints, or None if absent."""
+    if not value:
+        return None
+    return [int(v) for v in str(value).split(",") if v.strip()]
+
+
+def list_inventory(product_ids=None):
+    """All inventory, or only the rows for product_ids, in one query."""
+    query = Inventory.query
+    if product_ids is not None:
+        query = query.filter(Inventory.product_id.in_(product_ids))
+    return [i.to_dict() for i in query.all()]
+
+
+def _default_inventory(product_id):
+    return {"product_id": product_id, "quantity": 0, "warehouse": "main"}
+
+
+def get_inventory(product_id):
+    item = Inventory.query.filter_by(product_id=product_id).first()
+    if not item:
+        return _default_inventory(product_id)
+    return item.to_dict()
+
+
+def update_inventory(product_id, data):
+    """Insert or update the product's stock in one INSERT ... ON CONFLICT round-trip."""
+    stmt = insert(Inventory).values(
+        product_id=product_id,
+        quantity=data.get("quantity", 0),
+        warehouse=data.get("warehouse", "main"),
+    )
+    # On an existing row only the fields present in the request change.
+    updates = {k: stmt.excluded[k] for k in ("quantity", "warehouse") if k in data}
+    updates["updated_at"] = datetime.now(timezone.utc)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Inventory.product_id], set_=updates
+    ).returning(Inventory)
+    item = db.session.scalars(
+        stmt, execution_options={"populate_existing": True}
+    ).one()
+    db.session.commit()
+    return item.to_dict()
@@ -6,7 +6,7 @@ class Inventory(db.Model):
     __tablename__ = "inventory"
 
     id = db.Column(db.Integer, primary_key=True)
-    product_id = db.Column(db.Integer, nullable=False, index=True)
+    product_id = db.Column(db.Integer, nullable=False, index=True, unique=True)
     quantity = db.Column(db.Integer, nullable=False, default=0)
     warehouse = db.Column(db.String(100), default="main")
     updated_at = db.Column(